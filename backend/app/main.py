@@ -1,10 +1,16 @@
 """FastAPI application entry point"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
 from app.config import settings
 from app.routers import auth, transcript, playlist, analysis, cache, content, health
+from app.services.web_search import get_web_search_service
+
+# Threads available for blocking I/O offloaded from the event loop
+BLOCKING_IO_WORKERS = 32
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -90,4 +96,15 @@ async def startup_event():
             print("INFO: Using default JWT_SECRET_KEY in development mode.")
             print("      Generate a production secret with: openssl rand -hex 32")
 
+    # Blocking YouTube calls run via asyncio.to_thread on the default executor
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=BLOCKING_IO_WORKERS)
+    )
+
     print(f"\nApplication starting in {settings.ENVIRONMENT.upper()} mode...")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release shared HTTP connection pools"""
+    await get_web_search_service().aclose()
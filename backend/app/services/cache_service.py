@@ -3,6 +3,7 @@ import logging
 from datetime import datetime
 from typing import Optional, List, Dict, Any, Union
 import uuid
+import orjson
 from sqlmodel import Session, select, col, or_
 
 from app.models.cache import Transcript
@@ -134,7 +135,9 @@ class TranscriptCacheService:
             query = select(Transcript).where(Transcript.video_id == video_id, Transcript.user_id == user_id)
             existing = session.exec(query).first()
 
-            transcript_data_json = json.dumps(transcript_data) if transcript_data else None
+            # Snippet lists run to thousands of entries; orjson serializes
+            # them several times faster than json.dumps
+            transcript_data_json = orjson.dumps(transcript_data).decode() if transcript_data else None
             now = datetime.utcnow()
 
             # Calculate word_count if not provided and transcript exists
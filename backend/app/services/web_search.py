@@ -11,11 +11,16 @@ Supports:
 
 import logging
 import re
+import time
 import asyncio
-from typing import Optional, List, Dict, Any
-from dataclasses import dataclass
+from typing import Optional, List, Dict, Any, Hashable, Tuple
+from dataclasses import dataclass, replace
+from functools import lru_cache
 
 import httpx
+import orjson
+
+from app.utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -34,9 +39,12 @@ class ClaimVerificationResult:
     search_url: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SourceAttribution:
-    """Result of a quote source verification."""
+    """Result of a quote source verification.
+
+    Immutable, since instances are shared through the quote cache.
+    """
 
     quote: str
     source: Optional[str]
@@ -47,6 +55,218 @@ class SourceAttribution:
     search_url: Optional[str]
 
 
+# Known source patterns for quick matching
+KNOWN_SOURCES = {
+    "religious": [
+        r"bible", r"quran", r"torah", r"bhagavad.?gita", r"vedas?",
+        r"proverbs?\s+\d+", r"psalm\s+\d+", r"matthew\s+\d+", r"john\s+\d+",
+        r"romans\s+\d+", r"corinthians\s+\d+", r"genesis\s+\d+", r"exodus\s+\d+"
+    ],
+    "political": [
+        r"declaration\s+of\s+independence", r"constitution", r"gettysburg",
+        r"inaugural\s+address", r"state\s+of\s+the\s+union",
+        r"i\s+have\s+a\s+dream", r"ask\s+not\s+what\s+your\s+country"
+    ],
+    "literary": [
+        r"shakespeare", r"hamlet", r"macbeth", r"romeo\s+and\s+juliet",
+        r"dickens", r"tale\s+of\s+two\s+cities", r"homer", r"odyssey", r"iliad",
+        r"to\s+be\s+or\s+not\s+to\s+be", r"all\s+the\s+world'?s\s+a\s+stage"
+    ],
+    "philosophical": [
+        r"plato", r"aristotle", r"socrates", r"nietzsche", r"kant",
+        r"descartes", r"i\s+think,?\s+therefore", r"allegory\s+of\s+the\s+cave"
+    ]
+}
+
+# Literal keywords, at least one of which appears in any text matched by
+# KNOWN_SOURCES. Used as a cheap substring prefilter before the regex.
+KNOWN_SOURCE_KEYWORDS = (
+    "bible", "quran", "torah", "bhagavad", "veda", "proverb", "psalm",
+    "matthew", "john", "romans", "corinthians", "genesis", "exodus",
+    "declaration", "constitution", "gettysburg", "inaugural", "union",
+    "dream", "country",
+    "shakespeare", "hamlet", "macbeth", "romeo", "dickens", "cities",
+    "homer", "odyssey", "iliad", "not", "stage",
+    "plato", "aristotle", "socrates", "nietzsche", "kant", "descartes",
+    "therefore", "allegory",
+)
+
+# Biblical book + chapter/verse reference (e.g. "John 3:16")
+BIBLE_PATTERN = (
+    r"(?P<bible_book>genesis|exodus|leviticus|numbers|deuteronomy|joshua|judges|ruth|"
+    r"samuel|kings|chronicles|ezra|nehemiah|esther|job|psalms?|proverbs?|"
+    r"ecclesiastes|song\s+of\s+songs?|isaiah|jeremiah|lamentations|ezekiel|"
+    r"daniel|hosea|joel|amos|obadiah|jonah|micah|nahum|habakkuk|zephaniah|"
+    r"haggai|zechariah|malachi|matthew|mark|luke|john|acts|romans|"
+    r"corinthians|galatians|ephesians|philippians|colossians|thessalonians|"
+    r"timothy|titus|philemon|hebrews|james|peter|jude|revelation)"
+    r"\s*\d+[:\d]*"
+)
+
+# Display casing for book names matched by BIBLE_PATTERN
+_BIBLE_TITLECASE = {
+    book.lower(): book for book in (
+        "Genesis", "Exodus", "Leviticus", "Numbers", "Deuteronomy", "Joshua",
+        "Judges", "Ruth", "Samuel", "Kings", "Chronicles", "Ezra", "Nehemiah",
+        "Esther", "Job", "Psalm", "Psalms", "Proverb", "Proverbs",
+        "Ecclesiastes", "Isaiah", "Jeremiah", "Lamentations", "Ezekiel",
+        "Daniel", "Hosea", "Joel", "Amos", "Obadiah", "Jonah", "Micah", "Nahum",
+        "Habakkuk", "Zephaniah", "Haggai", "Zechariah", "Malachi", "Matthew",
+        "Mark", "Luke", "John", "Acts", "Romans", "Corinthians", "Galatians",
+        "Ephesians", "Philippians", "Colossians", "Thessalonians", "Timothy",
+        "Titus", "Philemon", "Hebrews", "James", "Peter", "Jude", "Revelation",
+    )
+}
+
+# Famous speakers/authors: pattern -> (source, source_type, confidence)
+FAMOUS_SOURCES = {
+    r"martin\s+luther\s+king": ("Martin Luther King Jr.", "political", 0.9),
+    r"abraham\s+lincoln": ("Abraham Lincoln", "political", 0.9),
+    r"winston\s+churchill": ("Winston Churchill", "political", 0.9),
+    r"john\s+f\.?\s*kennedy|jfk": ("John F. Kennedy", "political", 0.9),
+    r"shakespeare": ("William Shakespeare", "literary", 0.9),
+    r"plato": ("Plato", "philosophical", 0.85),
+    r"aristotle": ("Aristotle", "philosophical", 0.85),
+    r"socrates": ("Socrates", "philosophical", 0.85),
+    r"confucius": ("Confucius", "philosophical", 0.85),
+    r"mark\s+twain": ("Mark Twain", "literary", 0.85),
+    r"oscar\s+wilde": ("Oscar Wilde", "literary", 0.85),
+    r"einstein": ("Albert Einstein", "scientific", 0.85),
+    r"gandhi": ("Mahatma Gandhi", "political", 0.85),
+    r"nelson\s+mandela": ("Nelson Mandela", "political", 0.9),
+}
+
+# Plain single-word patterns are matched by whole-word dict lookup on the
+# tokenized quote instead of running the regex engine.
+_LITERAL_SOURCE_TYPES = {
+    pattern: source_type
+    for source_type, patterns in KNOWN_SOURCES.items()
+    for pattern in patterns if pattern.isalpha()
+}
+_TOKEN_RE = re.compile(r"[a-z]+")
+
+# Remaining (multi-word/numeric) patterns are compiled once at import.
+# Each category becomes a named group of a single alternation so one scan
+# yields both the match and its category (via ``match.lastgroup``);
+# quotes are lowercased before matching.
+_CATEGORY_RE = re.compile("|".join(
+    f"(?P<{source_type}>{'|'.join(p for p in patterns if not p.isalpha())})"
+    for source_type, patterns in KNOWN_SOURCES.items()
+    if not all(p.isalpha() for p in patterns)
+))
+
+# Famous sources are identified as "f<index>" into _FAMOUS_INFO. Plain
+# single-word patterns are found with str.find; bible references and the
+# remaining patterns are fused into one regex so each text is scanned
+# once (``match.lastgroup`` is "bible" or "f<index>"). Text is lowercased
+# before matching, which is much cheaper than IGNORECASE on a large
+# alternation.
+_FAMOUS_INFO = list(FAMOUS_SOURCES.values())
+_FAMOUS_LITERALS = [
+    (pattern, f"f{i}") for i, pattern in enumerate(FAMOUS_SOURCES) if pattern.isalpha()
+]
+_EXTRACT_RE = re.compile("|".join(
+    [f"(?P<bible>{BIBLE_PATTERN})"]
+    + [f"(?P<f{i}>{pattern})" for i, pattern in enumerate(FAMOUS_SOURCES) if not pattern.isalpha()]
+))
+
+# Quote database sites recognized in result URLs
+_QUOTE_SITES_RE = re.compile(r"brainyquote|goodreads|quoteinvestigator|wikiquote", re.IGNORECASE)
+
+# Author name in quote-site result titles ("... by Mark Twain | Goodreads")
+_AUTHOR_RE = re.compile(r"by\s+([^|,\-]+)", re.IGNORECASE)
+
+# Claim verdict keywords, one named group per class so a single scan of a
+# result yields a bitmask of the classes present. Keywords must start a
+# word ("unverified" is not "verified") but may carry a suffix ("myths").
+_VERDICT_RE = re.compile(
+    r"\b(?:(?P<positive>true|correct|verified|confirmed|accurate)"
+    r"|(?P<negative>false|incorrect|misleading|debunked)"
+    r"|(?P<myth>myth|hoax))",
+    re.IGNORECASE
+)
+_POSITIVE, _NEGATIVE, _MYTH = 1, 2, 4
+_VERDICT_BITS = {"positive": _POSITIVE, "negative": _NEGATIVE, "myth": _MYTH}
+
+# Fact-checking sites, whose verdicts are weighted double
+_FACT_CHECK_SITE_RE = re.compile("|".join(re.escape(site) for site in (
+    "snopes.com", "politifact.com", "factcheck.org",
+    "reuters.com/fact-check", "apnews.com/ap-fact-check",
+)), re.IGNORECASE)
+
+
+def _normalize_text(text: str) -> str:
+    """Lowercase text and collapse whitespace runs (used as cache key)."""
+    return " ".join(text.lower().split())
+
+
+def _result_haystack(result: Dict[str, Any]) -> str:
+    """Normalized title and content of a search result, for quote lookup.
+
+    The NUL separator keeps a quote from matching across the two fields.
+    """
+    return f"{_normalize_text(result.get('title', ''))}\x00{_normalize_text(result.get('content', ''))}"
+
+
+def _find_attribution(text: str) -> Optional[Tuple[str, str, str]]:
+    """
+    Find the leftmost bible reference or famous source in ``text``.
+
+    Returns:
+        (group, matched text, bible book) where group is "bible" or
+        "f<index>" (matched text and book are only set for "bible"),
+        or None if nothing matches
+    """
+    lowered = text.lower()
+
+    literal_pos, literal_group = len(lowered), None
+    for literal, group in _FAMOUS_LITERALS:
+        pos = lowered.find(literal)
+        if pos != -1 and pos < literal_pos:
+            literal_pos, literal_group = pos, group
+
+    match = _EXTRACT_RE.search(lowered)
+    if match and match.start() < literal_pos:
+        if match.lastgroup != "bible":
+            return match.lastgroup, "", ""
+        # Report the original casing unless lowering changed offsets
+        source = text if len(text) == len(lowered) else lowered
+        return (
+            "bible",
+            source[match.start():match.end()],
+            source[match.start("bible_book"):match.end("bible_book")],
+        )
+    if literal_group is not None:
+        return literal_group, "", ""
+    return None
+
+
+@lru_cache(maxsize=8192)
+def _match_source_type(quote_lower: str) -> Optional[str]:
+    """
+    Return the KNOWN_SOURCES category matched by a normalized quote.
+
+    Pure function of the (stripped, lowercased) quote, memoized so
+    repeated quotes skip the keyword scan and regex entirely.
+    """
+    # Most quotes contain no candidate keyword; skip the regex entirely
+    if not any(keyword in quote_lower for keyword in KNOWN_SOURCE_KEYWORDS):
+        return None
+
+    literal_pos, literal_type = len(quote_lower), None
+    for token in _TOKEN_RE.finditer(quote_lower):
+        source_type = _LITERAL_SOURCE_TYPES.get(token.group())
+        if source_type:
+            literal_pos, literal_type = token.start(), source_type
+            break
+
+    # Leftmost match wins, as in _find_attribution
+    match = _CATEGORY_RE.search(quote_lower)
+    if match and match.start() < literal_pos:
+        return match.lastgroup
+    return literal_type
+
+
 class WebSearchService:
     """
     Service for verifying quote attributions using self-hosted SearXNG.
@@ -57,33 +277,54 @@ class WebSearchService:
 
     SEARXNG_URL = "https://s.llam.ai"
     SEARCH_TIMEOUT = 15.0  # seconds
-
-    # Known source patterns for quick matching
-    KNOWN_SOURCES = {
-        "religious": [
-            r"bible", r"quran", r"torah", r"bhagavad.?gita", r"vedas?",
-            r"proverbs?\s+\d+", r"psalm\s+\d+", r"matthew\s+\d+", r"john\s+\d+",
-            r"romans\s+\d+", r"corinthians\s+\d+", r"genesis\s+\d+", r"exodus\s+\d+"
-        ],
-        "political": [
-            r"declaration\s+of\s+independence", r"constitution", r"gettysburg",
-            r"inaugural\s+address", r"state\s+of\s+the\s+union",
-            r"i\s+have\s+a\s+dream", r"ask\s+not\s+what\s+your\s+country"
-        ],
-        "literary": [
-            r"shakespeare", r"hamlet", r"macbeth", r"romeo\s+and\s+juliet",
-            r"dickens", r"tale\s+of\s+two\s+cities", r"homer", r"odyssey", r"iliad",
-            r"to\s+be\s+or\s+not\s+to\s+be", r"all\s+the\s+world'?s\s+a\s+stage"
-        ],
-        "philosophical": [
-            r"plato", r"aristotle", r"socrates", r"nietzsche", r"kant",
-            r"descartes", r"i\s+think,?\s+therefore", r"allegory\s+of\s+the\s+cave"
-        ]
-    }
+    HEALTH_TIMEOUT = 5.0  # seconds
+    HEALTH_CACHE_TTL = 5.0  # seconds a health check result is reused
+    BATCH_CONCURRENCY = 5  # max in-flight searches per batch
+    QUOTE_CACHE_SIZE = 4096
+    QUOTE_CACHE_TTL = 24 * 60 * 60  # seconds
+    CLAIM_CACHE_SIZE = 1024
+    ETAG_CACHE_SIZE = 1024
+    QUOTE_RESULTS_LIMIT = 5  # search results inspected per quote
+    CLAIM_RESULTS_LIMIT = 8  # search results inspected per claim
+    QUOTES_PER_COMBINED_SEARCH = 4  # short quotes OR-ed into one batch search
+    COMBINED_QUOTE_MAX_CHARS = 80  # longer quotes are always searched alone
+    CONFIDENT_MATCH_THRESHOLD = 0.9  # highest attribution confidence we assign
+    RESULT_TITLE_SCAN_CHARS = 256
+    RESULT_CONTENT_SCAN_CHARS = 512
 
     def __init__(self, searxng_url: Optional[str] = None):
         """Initialize the web search service."""
         self.searxng_url = searxng_url or self.SEARXNG_URL
+        self._client: Optional[httpx.AsyncClient] = None
+        self._quote_cache = TTLCache(self.QUOTE_CACHE_SIZE, self.QUOTE_CACHE_TTL)
+        self._claim_cache = TTLCache(self.CLAIM_CACHE_SIZE, self.QUOTE_CACHE_TTL)
+        # (kind, normalized text) -> task for a lookup already in flight
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        # (checked_at, healthy) from the last check_connection()
+        self._last_health: Optional[Tuple[float, bool]] = None
+        # search query -> (ETag, parsed results) for conditional requests
+        self._etag_cache = TTLCache(self.ETAG_CACHE_SIZE, self.QUOTE_CACHE_TTL)
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use.
+
+        Reusing one client keeps connections to SearXNG alive across
+        searches instead of paying a TCP+TLS handshake per request.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.searxng_url,
+                timeout=self.SEARCH_TIMEOUT,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+                headers={"Accept": "application/json"}
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def verify_quote(self, quote: str) -> SourceAttribution:
         """
@@ -94,18 +335,44 @@ class WebSearchService:
 
         Returns:
             SourceAttribution with source details if found
+
+        Successful results are cached per normalized quote, so repeated
+        quotes skip both pattern matching and the SearXNG round-trip.
+        Concurrent calls for the same quote share a single search.
         """
-        # First check against known patterns
-        quick_match = self._quick_pattern_match(quote)
-        if quick_match:
-            return quick_match
+        local_result = self._verify_quote_locally(quote)
+        if local_result:
+            return local_result
+
+        result = await self._singleflight(
+            ("quote", _normalize_text(quote)),
+            lambda: self._lookup_quote(quote)
+        )
+        return result if result.quote == quote else replace(result, quote=quote)
 
-        # Search using SearXNG
+    async def _singleflight(self, key: Hashable, lookup) -> Any:
+        """
+        Run ``lookup()`` once for all concurrent callers using the same key.
+
+        The shared task is shielded, so a cancelled caller does not cancel
+        the lookup for the others.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(lookup())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _lookup_quote(self, quote: str) -> SourceAttribution:
+        """Search SearXNG for a quote's source, caching successful results."""
         try:
             search_results = await self._search_searxng(quote)
-            return self._parse_search_results(quote, search_results)
+            result = self._parse_search_results(quote, search_results)
+            self._quote_cache.set(_normalize_text(quote), result)
+            return result
         except Exception as e:
-            logger.error(f"Quote verification failed for '{quote[:50]}...': {e}")
+            logger.error("Quote verification failed for '%.50s...': %s", quote, e)
             return SourceAttribution(
                 quote=quote,
                 source=None,
@@ -116,44 +383,139 @@ class WebSearchService:
                 search_url=None
             )
 
-    async def verify_quotes_batch(self, quotes: List[str]) -> List[SourceAttribution]:
+    async def verify_quotes_batch(
+        self,
+        quotes: List[str],
+        concurrency: Optional[int] = None
+    ) -> List[SourceAttribution]:
         """
-        Verify multiple quotes in batch.
+        Verify multiple quotes concurrently.
+
+        Quotes resolved from the cache or known patterns need no search.
+        Short quotes are grouped QUOTES_PER_COMBINED_SEARCH at a time into a
+        single OR-joined search, and each result is assigned to the quotes
+        it contains; quotes no result mentions (and long quotes) fall back
+        to an individual search.
 
         Args:
             quotes: List of phrases to verify
+            concurrency: Max searches in flight at once
+                (default BATCH_CONCURRENCY)
 
         Returns:
-            List of SourceAttribution results
+            List of SourceAttribution results, in the same order as quotes
         """
-        results = []
-        for quote in quotes:
-            result = await self.verify_quote(quote)
-            results.append(result)
+        semaphore = asyncio.Semaphore(concurrency or self.BATCH_CONCURRENCY)
+        results: List[Optional[SourceAttribution]] = [None] * len(quotes)
+
+        async def verify_one(index: int) -> None:
+            async with semaphore:
+                results[index] = await self.verify_quote(quotes[index])
+
+        async def verify_group(indices: List[int]) -> None:
+            async with semaphore:
+                try:
+                    search_results = await self._search_searxng_combined(
+                        [quotes[i] for i in indices]
+                    )
+                except Exception as e:
+                    logger.warning("Combined quote search failed, searching individually: %s", e)
+                    search_results = {"results": []}
+
+            # Normalize each result once, not once per quote in the group
+            haystacks = [
+                (result, _result_haystack(result))
+                for result in search_results.get("results", [])
+            ]
+            unmatched = []
+            for i in indices:
+                result = self._attribute_from_combined_results(quotes[i], haystacks)
+                if result:
+                    results[i] = result
+                else:
+                    unmatched.append(i)
+            await asyncio.gather(*[verify_one(i) for i in unmatched])
+
+        tasks = []
+        combinable = []
+        for i, quote in enumerate(quotes):
+            local_result = self._verify_quote_locally(quote)
+            if local_result:
+                results[i] = local_result
+            elif len(quote.strip()) <= self.COMBINED_QUOTE_MAX_CHARS:
+                combinable.append(i)
+            else:
+                tasks.append(verify_one(i))
+
+        for start in range(0, len(combinable), self.QUOTES_PER_COMBINED_SEARCH):
+            group = combinable[start:start + self.QUOTES_PER_COMBINED_SEARCH]
+            tasks.append(verify_group(group) if len(group) > 1 else verify_one(group[0]))
+
+        await asyncio.gather(*tasks)
         return results
 
+    def _verify_quote_locally(self, quote: str) -> Optional[SourceAttribution]:
+        """
+        Resolve a quote from the cache or known patterns, without searching.
+
+        Returns:
+            SourceAttribution if resolved locally, None if a search is needed
+        """
+        cache_key = _normalize_text(quote)
+        cached = self._quote_cache.get(cache_key)
+        if cached is not None:
+            return cached if cached.quote == quote else replace(cached, quote=quote)
+
+        quick_match = self._quick_pattern_match(quote)
+        if quick_match:
+            self._quote_cache.set(cache_key, quick_match)
+        return quick_match
+
+    def _attribute_from_combined_results(
+        self,
+        quote: str,
+        haystacks: List[Tuple[Dict[str, Any], str]]
+    ) -> Optional[SourceAttribution]:
+        """
+        Attribute a quote from a combined search's results.
+
+        Only results whose title or content contain the quote are used.
+
+        Args:
+            quote: The phrase to attribute
+            haystacks: (result, _result_haystack(result)) pairs
+
+        Returns:
+            SourceAttribution, or None if no result mentions the quote
+        """
+        needle = _normalize_text(quote)
+        matched = [result for result, haystack in haystacks if needle in haystack]
+        if not matched:
+            return None
+
+        result = self._parse_search_results(quote, {"results": matched})
+        self._quote_cache.set(needle, result)
+        return result
+
     def _quick_pattern_match(self, quote: str) -> Optional[SourceAttribution]:
         """
         Quick pattern matching against known famous quotes.
 
         Returns SourceAttribution if a known pattern is matched.
         """
-        quote_lower = quote.lower()
-
-        for source_type, patterns in self.KNOWN_SOURCES.items():
-            for pattern in patterns:
-                if re.search(pattern, quote_lower):
-                    return SourceAttribution(
-                        quote=quote,
-                        source=f"Likely {source_type} source (pattern match)",
-                        source_type=source_type,
-                        confidence=0.7,
-                        verified=False,
-                        verification_details="Matched known pattern, not web-verified",
-                        search_url=None
-                    )
+        source_type = _match_source_type(quote.strip().lower())
+        if source_type is None:
+            return None
 
-        return None
+        return SourceAttribution(
+            quote=quote,
+            source=f"Likely {source_type} source (pattern match)",
+            source_type=source_type,
+            confidence=0.7,
+            verified=False,
+            verification_details="Matched known pattern, not web-verified",
+            search_url=None
+        )
 
     async def _search_searxng(self, quote: str) -> Dict[str, Any]:
         """
@@ -163,7 +525,7 @@ class WebSearchService:
             quote: The phrase to search for
 
         Returns:
-            Raw search results from SearXNG
+            SearXNG response trimmed to the top QUOTE_RESULTS_LIMIT results
         """
         # Clean up the quote for searching
         clean_quote = quote.strip()
@@ -172,24 +534,64 @@ class WebSearchService:
             clean_quote = clean_quote[:150] + "..."
 
         search_query = f'"{clean_quote}" source OR origin OR attributed OR quote'
+        return await self._fetch_search(search_query, self.QUOTE_RESULTS_LIMIT)
 
-        async with httpx.AsyncClient(timeout=self.SEARCH_TIMEOUT) as client:
-            response = await client.get(
-                f"{self.searxng_url}/search",
-                params={
-                    "q": search_query,
-                    "format": "json",
-                    "categories": "general",
-                    "language": "en",
-                    "safesearch": 0,
-                    "pageno": 1
-                },
-                headers={
-                    "Accept": "application/json"
-                }
-            )
-            response.raise_for_status()
-            return response.json()
+    async def _search_searxng_combined(self, quotes: List[str]) -> Dict[str, Any]:
+        """
+        Search for several short quotes with one OR-joined SearXNG query.
+
+        Args:
+            quotes: The phrases to search for
+
+        Returns:
+            SearXNG response trimmed to QUOTE_RESULTS_LIMIT results per quote
+        """
+        search_query = " OR ".join(f'"{quote.strip()}"' for quote in quotes)
+        return await self._fetch_search(search_query, self.QUOTE_RESULTS_LIMIT * len(quotes))
+
+    async def _fetch_search(self, search_query: str, limit: int) -> Dict[str, Any]:
+        """
+        Run a SearXNG JSON search.
+
+        Args:
+            search_query: Full query string
+            limit: Number of top results to keep
+
+        Returns:
+            SearXNG response trimmed to the top ``limit`` results
+        """
+        # Revalidate repeated queries so unchanged results come back as 304
+        headers = {}
+        cached = self._etag_cache.get(search_query)
+        if cached is not None:
+            headers["If-None-Match"] = cached[0]
+
+        client = await self._get_client()
+        response = await client.get(
+            "/search",
+            params={
+                "q": search_query,
+                "format": "json",
+                "categories": "general",
+                "language": "en",
+                "safesearch": 0,
+                "pageno": 1
+            },
+            headers=headers
+        )
+        if response.status_code == 304 and cached is not None:
+            return cached[1]
+
+        response.raise_for_status()
+        # Only the top results are ever inspected; drop the rest right away
+        # so they are not retained in the ETag cache
+        parsed = orjson.loads(response.content)
+        results = {"results": parsed.get("results", [])[:limit]}
+
+        etag = response.headers.get("etag")
+        if etag:
+            self._etag_cache.set(search_query, (etag, results))
+        return results
 
     def _parse_search_results(self, quote: str, results: Dict[str, Any]) -> SourceAttribution:
         """
@@ -214,18 +616,21 @@ class WebSearchService:
             )
 
         # Analyze top results
-        top_results = results["results"][:5]
+        top_results = results["results"][:self.QUOTE_RESULTS_LIMIT]
         source_candidates = []
 
         for result in top_results:
-            title = result.get("title", "").lower()
-            content = result.get("content", "").lower()
-            url = result.get("url", "")
-
             # Look for attribution patterns in results
-            source_info = self._extract_source_from_result(title, content, url)
+            source_info = self._extract_source_from_result(
+                result.get("title", ""),
+                result.get("content", ""),
+                result.get("url", "")
+            )
             if source_info:
                 source_candidates.append(source_info)
+                # Nothing scores higher than a confident match; stop scanning
+                if source_info["confidence"] >= self.CONFIDENT_MATCH_THRESHOLD:
+                    break
 
         if source_candidates:
             # Return the most confident source
@@ -260,72 +665,50 @@ class WebSearchService:
         """
         Extract source information from a search result.
 
+        Title and content are matched separately, without concatenating
+        them. Only the first
+        RESULT_TITLE_SCAN_CHARS / RESULT_CONTENT_SCAN_CHARS characters are
+        scanned: attributions almost always appear near the start of a
+        snippet, and the cap bounds regex work on unusually long results.
+
         Returns dict with source, type, confidence, and details.
         """
-        combined_text = f"{title} {content}"
-
-        # Check for biblical references
-        bible_patterns = [
-            r"(genesis|exodus|leviticus|numbers|deuteronomy|joshua|judges|ruth|"
-            r"samuel|kings|chronicles|ezra|nehemiah|esther|job|psalms?|proverbs?|"
-            r"ecclesiastes|song\s+of\s+songs?|isaiah|jeremiah|lamentations|ezekiel|"
-            r"daniel|hosea|joel|amos|obadiah|jonah|micah|nahum|habakkuk|zephaniah|"
-            r"haggai|zechariah|malachi|matthew|mark|luke|john|acts|romans|"
-            r"corinthians|galatians|ephesians|philippians|colossians|thessalonians|"
-            r"timothy|titus|philemon|hebrews|james|peter|jude|revelation)"
-            r"\s*\d+[:\d]*"
-        ]
-
-        for pattern in bible_patterns:
-            match = re.search(pattern, combined_text, re.IGNORECASE)
-            if match:
+        title = title[:self.RESULT_TITLE_SCAN_CHARS]
+        content = content[:self.RESULT_CONTENT_SCAN_CHARS]
+
+        found = _find_attribution(title) or _find_attribution(content)
+        if found:
+            group, matched, book = found
+            if group == "bible":
+                # Multi-word books ("song of songs") fall back to str.title()
+                book_title = _BIBLE_TITLECASE.get(book.lower()) or book.title()
                 return {
-                    "source": f"Bible - {match.group(0).title()}",
+                    "source": f"Bible - {book_title}{matched[len(book):]}",
                     "type": "religious",
                     "confidence": 0.85,
-                    "details": f"Biblical reference found: {match.group(0)}"
+                    "details": f"Biblical reference found: {matched}"
                 }
 
-        # Check for famous speakers/authors
-        famous_sources = {
-            r"martin\s+luther\s+king": ("Martin Luther King Jr.", "political", 0.9),
-            r"abraham\s+lincoln": ("Abraham Lincoln", "political", 0.9),
-            r"winston\s+churchill": ("Winston Churchill", "political", 0.9),
-            r"john\s+f\.?\s*kennedy|jfk": ("John F. Kennedy", "political", 0.9),
-            r"shakespeare": ("William Shakespeare", "literary", 0.9),
-            r"plato": ("Plato", "philosophical", 0.85),
-            r"aristotle": ("Aristotle", "philosophical", 0.85),
-            r"socrates": ("Socrates", "philosophical", 0.85),
-            r"confucius": ("Confucius", "philosophical", 0.85),
-            r"mark\s+twain": ("Mark Twain", "literary", 0.85),
-            r"oscar\s+wilde": ("Oscar Wilde", "literary", 0.85),
-            r"einstein": ("Albert Einstein", "scientific", 0.85),
-            r"gandhi": ("Mahatma Gandhi", "political", 0.85),
-            r"nelson\s+mandela": ("Nelson Mandela", "political", 0.9),
-        }
-
-        for pattern, (source, source_type, confidence) in famous_sources.items():
-            if re.search(pattern, combined_text, re.IGNORECASE):
-                return {
-                    "source": source,
-                    "type": source_type,
-                    "confidence": confidence,
-                    "details": f"Attributed to {source}"
-                }
+            source, source_type, confidence = _FAMOUS_INFO[int(group[1:])]
+            return {
+                "source": source,
+                "type": source_type,
+                "confidence": confidence,
+                "details": f"Attributed to {source}"
+            }
 
         # Check URL for quote databases
-        quote_sites = ["brainyquote", "goodreads", "quoteinvestigator", "wikiquote"]
-        for site in quote_sites:
-            if site in url.lower():
-                # Extract author from title if possible
-                author_match = re.search(r"by\s+([^|,\-]+)", title, re.IGNORECASE)
-                if author_match:
-                    return {
-                        "source": author_match.group(1).strip().title(),
-                        "type": "unknown",
-                        "confidence": 0.75,
-                        "details": f"Found on {site}"
-                    }
+        site_match = _QUOTE_SITES_RE.search(url)
+        if site_match:
+            # Extract author from title if possible
+            author_match = _AUTHOR_RE.search(title)
+            if author_match:
+                return {
+                    "source": author_match.group(1).strip().title(),
+                    "type": "unknown",
+                    "confidence": 0.75,
+                    "details": f"Found on {site_match.group(0).lower()}"
+                }
 
         return None
 
@@ -333,24 +716,30 @@ class WebSearchService:
         """
         Check if SearXNG is reachable.
 
+        Uses a single HEAD request on the search endpoint; any response
+        below 500 means the server is up. The answer is reused for
+        HEALTH_CACHE_TTL seconds so repeated checks skip the network.
+
         Returns:
             True if SearXNG is accessible, False otherwise
         """
+        now = time.monotonic()
+        if self._last_health is not None and now - self._last_health[0] < self.HEALTH_CACHE_TTL:
+            return self._last_health[1]
+
+        client = await self._get_client()
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f"{self.searxng_url}/healthz")
-                return response.status_code == 200
+            response = await client.head(
+                "/search",
+                params={"q": "", "format": "json"},
+                timeout=self.HEALTH_TIMEOUT
+            )
+            healthy = response.status_code < 500
         except Exception:
-            # Try a simple search as fallback health check
-            try:
-                async with httpx.AsyncClient(timeout=5.0) as client:
-                    response = await client.get(
-                        f"{self.searxng_url}/search",
-                        params={"q": "test", "format": "json"}
-                    )
-                    return response.status_code == 200
-            except Exception:
-                return False
+            healthy = False
+
+        self._last_health = (now, healthy)
+        return healthy
 
     # =========================================================================
     # CLAIM VERIFICATION METHODS (for Manipulation Analysis)
@@ -365,6 +754,9 @@ class WebSearchService:
 
         Returns:
             ClaimVerificationResult with verification status
+
+        Successful results are cached per normalized claim, and concurrent
+        calls for the same claim share a single search.
         """
         # Skip very short or vague claims
         if len(claim_text.strip()) < 20:
@@ -379,12 +771,26 @@ class WebSearchService:
                 search_url=None
             )
 
+        cache_key = _normalize_text(claim_text)
+        result = self._claim_cache.get(cache_key)
+        if result is None:
+            result = await self._singleflight(
+                ("claim", cache_key),
+                lambda: self._lookup_claim(claim_text, cache_key)
+            )
+        # Callers get their own copy; cached results are shared
+        return replace(result, claim_text=claim_text)
+
+    async def _lookup_claim(self, claim_text: str, cache_key: str) -> ClaimVerificationResult:
+        """Search for evidence about a claim, caching successful results."""
         try:
             # Search for the claim with fact-check context
             search_results = await self._search_claim(claim_text)
-            return self._parse_claim_results(claim_text, search_results)
+            result = self._parse_claim_results(claim_text, search_results)
+            self._claim_cache.set(cache_key, result)
+            return result
         except Exception as e:
-            logger.error(f"Claim verification failed for '{claim_text[:50]}...': {e}")
+            logger.error("Claim verification failed for '%.50s...': %s", claim_text, e)
             return ClaimVerificationResult(
                 claim_text=claim_text,
                 is_verified=False,
@@ -399,29 +805,40 @@ class WebSearchService:
     async def verify_claims_batch(
         self,
         claims: List[str],
-        rate_limit_delay: float = 0.5
+        rate_limit_delay: float = 0.5,
+        concurrency: Optional[int] = None
     ) -> List[ClaimVerificationResult]:
         """
-        Verify multiple claims with rate limiting.
+        Verify multiple claims concurrently with rate limiting.
+
+        Searches start at most once per ``rate_limit_delay`` seconds, but
+        a slow search no longer holds up the ones after it.
 
         Args:
             claims: List of claim texts to verify
-            rate_limit_delay: Seconds to wait between searches
+            rate_limit_delay: Minimum seconds between search starts
+            concurrency: Max searches in flight at once
+                (default BATCH_CONCURRENCY)
 
         Returns:
-            List of ClaimVerificationResult
+            List of ClaimVerificationResult, in the same order as claims
         """
-        results = []
-
-        for i, claim in enumerate(claims):
-            result = await self.verify_claim(claim)
-            results.append(result)
-
-            # Rate limiting - don't hammer the search server
-            if i < len(claims) - 1:
-                await asyncio.sleep(rate_limit_delay)
-
-        return results
+        semaphore = asyncio.Semaphore(concurrency or self.BATCH_CONCURRENCY)
+        start_lock = asyncio.Lock()
+        next_start = 0.0
+
+        async def verify_one(claim: str) -> ClaimVerificationResult:
+            nonlocal next_start
+            async with semaphore:
+                # Rate limiting - don't hammer the search server
+                async with start_lock:
+                    wait = next_start - time.monotonic()
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                    next_start = time.monotonic() + rate_limit_delay
+                return await self.verify_claim(claim)
+
+        return list(await asyncio.gather(*[verify_one(claim) for claim in claims]))
 
     async def _search_claim(self, claim_text: str) -> Dict[str, Any]:
         """
@@ -431,7 +848,7 @@ class WebSearchService:
             claim_text: The claim to search for
 
         Returns:
-            Raw search results from SearXNG
+            SearXNG response trimmed to the top CLAIM_RESULTS_LIMIT results
         """
         # Clean and truncate
         clean_claim = claim_text.strip()
@@ -440,24 +857,7 @@ class WebSearchService:
 
         # Build search query for fact-checking
         search_query = f'"{clean_claim}" fact check OR true OR false OR evidence'
-
-        async with httpx.AsyncClient(timeout=self.SEARCH_TIMEOUT) as client:
-            response = await client.get(
-                f"{self.searxng_url}/search",
-                params={
-                    "q": search_query,
-                    "format": "json",
-                    "categories": "general",
-                    "language": "en",
-                    "safesearch": 0,
-                    "pageno": 1
-                },
-                headers={
-                    "Accept": "application/json"
-                }
-            )
-            response.raise_for_status()
-            return response.json()
+        return await self._fetch_search(search_query, self.CLAIM_RESULTS_LIMIT)
 
     def _parse_claim_results(
         self,
@@ -486,49 +886,43 @@ class WebSearchService:
                 search_url=f"{self.searxng_url}/search?q={claim_text[:50]}"
             )
 
-        top_results = results["results"][:8]
+        top_results = results["results"][:self.CLAIM_RESULTS_LIMIT]
+        # URLs of results with a clear verdict (only URLs are reported)
         supporting = []
         contradicting = []
-        neutral = []
-
-        # Patterns for fact-checking sites
-        fact_check_sites = [
-            "snopes.com", "politifact.com", "factcheck.org",
-            "reuters.com/fact-check", "apnews.com/ap-fact-check"
-        ]
+        # Evidence weights; fact-checking sites count double
+        supporting_count = 0
+        contradicting_count = 0
 
         for result in top_results:
-            title = result.get("title", "").lower()
-            content = result.get("content", "").lower()
+            title = result.get("title", "")
+            content = result.get("content", "")
             url = result.get("url", "")
             combined = f"{title} {content}"
 
-            source_info = {
-                "url": url,
-                "title": result.get("title", ""),
-                "snippet": result.get("content", "")[:200]
-            }
-
             # Check for explicit verdicts
-            if any(word in combined for word in ["true", "correct", "verified", "confirmed", "accurate"]):
-                if not any(word in combined for word in ["false", "incorrect", "misleading", "debunked"]):
-                    supporting.append(source_info)
-            elif any(word in combined for word in ["false", "incorrect", "misleading", "debunked", "myth", "hoax"]):
-                contradicting.append(source_info)
+            verdict = 0
+            for match in _VERDICT_RE.finditer(combined):
+                verdict |= _VERDICT_BITS[match.lastgroup]
+
+            # Neutral and mixed results carry no evidence either way
+            if verdict & _POSITIVE:
+                if verdict & _NEGATIVE:
+                    continue
+                bucket = supporting
+            elif verdict:
+                bucket = contradicting
             else:
-                neutral.append(source_info)
+                continue
 
-            # Weight fact-checking sites higher
-            for site in fact_check_sites:
-                if site in url.lower():
-                    if source_info in supporting:
-                        supporting.append(source_info)  # Double weight
-                    elif source_info in contradicting:
-                        contradicting.append(source_info)  # Double weight
+            weight = 2 if _FACT_CHECK_SITE_RE.search(url) else 1
+            bucket.append(url)
+            if bucket is supporting:
+                supporting_count += weight
+            else:
+                contradicting_count += weight
 
         # Determine overall status
-        supporting_count = len(supporting)
-        contradicting_count = len(contradicting)
         total = supporting_count + contradicting_count
 
         if total == 0:
@@ -553,8 +947,8 @@ class WebSearchService:
             is_verified=verification_status == "verified",
             verification_status=verification_status,
             confidence=confidence,
-            supporting_sources=[s["url"] for s in supporting[:3]],
-            contradicting_sources=[s["url"] for s in contradicting[:3]],
+            supporting_sources=supporting[:3],
+            contradicting_sources=contradicting[:3],
             verification_details=details,
             search_url=top_results[0].get("url") if top_results else None
         )
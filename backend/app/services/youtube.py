@@ -1,6 +1,8 @@
 """YouTube transcript fetching service"""
 from typing import Dict, List, Optional
 import asyncio
+import random
+import threading
 from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_transcript_api._errors import (
     TranscriptsDisabled,
@@ -12,13 +14,76 @@ from youtube_transcript_api._errors import (
 )
 import yt_dlp
 
+from app.utils.ttl_cache import TTLCache
+
+# Transcript errors retrying will not fix -> error message
+_TERMINAL_ERRORS = {
+    TranscriptsDisabled: "Transcripts are disabled for this video",
+    NoTranscriptFound: "No transcript found for this video",
+    VideoUnavailable: "Video is unavailable or does not exist",
+}
+# Possibly temporary errors, retried -> message once retries run out
+_RETRYABLE_ERRORS = {
+    RequestBlocked: "Request blocked by YouTube. Please try again later.",
+    HTTPError: "HTTP error occurred: {}",
+    YouTubeRequestFailed: "YouTube request failed: {}",
+}
+_TERMINAL_ERROR_TYPES = tuple(_TERMINAL_ERRORS)
+_RETRYABLE_ERROR_TYPES = tuple(_RETRYABLE_ERRORS)
+
+
+def _error_message(messages: Dict[type, str], error: Exception) -> str:
+    """Look up the message for an error, matching subclasses (e.g. IpBlocked)"""
+    for error_type in type(error).__mro__:
+        message = messages.get(error_type)
+        if message is not None:
+            return message.format(error)
+    return str(error)
+
 
 class YouTubeService:
     """Service for fetching YouTube video transcripts"""
-    
+
+    TRANSCRIPT_CACHE_SIZE = 256
+    TRANSCRIPT_CACHE_TTL = 30 * 24 * 60 * 60  # seconds; transcripts rarely change
+    UNAVAILABLE_CACHE_TTL = 60 * 60  # seconds
+    METADATA_CACHE_SIZE = 2000
+    METADATA_CACHE_TTL = 24 * 60 * 60  # seconds
+    FETCH_TIMEOUT = 15.0  # seconds per transcript fetch attempt
+    YDL_OPTIONS = {
+        'quiet': True,
+        'no_warnings': True,
+        'skip_download': True,
+    }
+
     def __init__(self):
         """Initialize YouTube transcript API"""
-        self.api = YouTubeTranscriptApi()
+        # One YouTubeTranscriptApi per thread: its session is not thread-safe
+        self._api_local = threading.local()
+        # video_id -> get_transcript() result
+        self._transcript_cache = TTLCache(self.TRANSCRIPT_CACHE_SIZE, self.TRANSCRIPT_CACHE_TTL)
+        # video_id -> successful get_video_metadata() result
+        self._metadata_cache = TTLCache(self.METADATA_CACHE_SIZE, self.METADATA_CACHE_TTL)
+        # video_id -> metadata lookup already in flight
+        self._metadata_inflight: Dict[str, asyncio.Task] = {}
+        # One YoutubeDL per thread: it is costly to build and not thread-safe
+        self._ydl_local = threading.local()
+
+    def _get_api(self) -> YouTubeTranscriptApi:
+        """Get this thread's YouTubeTranscriptApi instance, creating it on first use"""
+        api = getattr(self._api_local, 'api', None)
+        if api is None:
+            api = YouTubeTranscriptApi()
+            self._api_local.api = api
+        return api
+
+    def _get_ydl(self) -> yt_dlp.YoutubeDL:
+        """Get this thread's YoutubeDL instance, creating it on first use"""
+        ydl = getattr(self._ydl_local, 'ydl', None)
+        if ydl is None:
+            ydl = yt_dlp.YoutubeDL(self.YDL_OPTIONS)
+            self._ydl_local.ydl = ydl
+        return ydl
     
     async def get_transcript(self, video_id: str, max_retries: int = 3) -> Dict:
         """
@@ -36,80 +101,77 @@ class YouTubeService:
                 "text": str (if success),
                 "error": str (if failure)
             }
+
+        Successful results are cached per video ID, so repeat requests
+        skip YouTube entirely. Unavailable videos are cached briefly;
+        other failures are not cached.
         """
+        cached = self._transcript_cache.get(video_id)
+        if cached is not None:
+            return cached
+
         last_error = None
 
         for attempt in range(max_retries):
             try:
-                # Add delay before retry attempts (exponential backoff)
+                # Add delay before retry attempts (exponential backoff with
+                # jitter, so concurrent requests don't retry in lockstep)
                 if attempt > 0:
-                    delay = 2 ** attempt  # 2s, 4s, 8s
+                    delay = (2 ** attempt) * (0.5 + random.random())  # ~1-3s, 2-6s
                     await asyncio.sleep(delay)
 
                 # CRITICAL: Use instance.fetch(), modern API pattern (v1.2.3+)
-                # Returns FetchedTranscript with FetchedTranscriptSnippet objects
-                fetched_transcript = self.api.fetch(video_id)
+                # Returns FetchedTranscript with FetchedTranscriptSnippet objects.
+                # fetch() does blocking HTTP, so run it off the event loop.
+                async with asyncio.timeout(self.FETCH_TIMEOUT):
+                    fetched_transcript = await asyncio.to_thread(
+                        lambda: self._get_api().fetch(video_id)
+                    )
 
-                # Format transcript snippets (iterate over FetchedTranscript)
-                transcript = [
-                    {
-                        "text": snippet.text,
+                # Format transcript snippets and collect their text in one
+                # pass over FetchedTranscript
+                transcript = []
+                texts = []
+                for snippet in fetched_transcript:
+                    text = snippet.text
+                    texts.append(text)
+                    transcript.append({
+                        "text": text,
                         "start": snippet.start,
                         "duration": snippet.duration
-                    }
-                    for snippet in fetched_transcript
-                ]
+                    })
 
                 # Combine into full text
-                full_text = " ".join([s["text"] for s in transcript])
+                full_text = " ".join(texts)
 
-                return {
+                result = {
                     "success": True,
                     "transcript": transcript,
                     "text": full_text
                 }
+                self._transcript_cache.set(video_id, result)
+                return result
 
-            except TranscriptsDisabled:
-                return {
-                    "success": False,
-                    "error": "Transcripts are disabled for this video"
-                }
-            except NoTranscriptFound:
-                return {
-                    "success": False,
-                    "error": "No transcript found for this video"
-                }
-            except VideoUnavailable:
-                return {
-                    "success": False,
-                    "error": "Video is unavailable or does not exist"
-                }
-            except RequestBlocked as e:
-                last_error = e
-                # Retry on RequestBlocked errors
-                if attempt < max_retries - 1:
-                    continue
-                return {
+            except _TERMINAL_ERROR_TYPES as e:
+                result = {
                     "success": False,
-                    "error": "Request blocked by YouTube. Please try again later."
+                    "error": _error_message(_TERMINAL_ERRORS, e)
                 }
-            except HTTPError as e:
+                if isinstance(e, VideoUnavailable):
+                    self._transcript_cache.set(video_id, result, ttl=self.UNAVAILABLE_CACHE_TTL)
+                return result
+            except _RETRYABLE_ERROR_TYPES as e:
                 last_error = e
-                # Retry on HTTP errors (might be temporary)
                 if attempt < max_retries - 1:
                     continue
                 return {
                     "success": False,
-                    "error": f"HTTP error occurred: {str(e)}"
+                    "error": _error_message(_RETRYABLE_ERRORS, e)
                 }
-            except YouTubeRequestFailed as e:
-                last_error = e
-                # Retry on general request failures
-                if attempt < max_retries - 1:
-                    continue
+            except TimeoutError:
                 return {
                     "success": False,
-                    "error": f"YouTube request failed: {str(e)}"
+                    "error": "YouTube transcript fetch timed out"
                 }
             except Exception as e:
                 return {
@@ -138,33 +200,48 @@ class YouTubeService:
                 "upload_date": str (YYYYMMDD format),
                 "success": bool
             }
+
+        Successful lookups are cached per video ID, and concurrent calls
+        for the same video share a single yt-dlp lookup.
         """
+        cached = self._metadata_cache.get(video_id)
+        if cached is not None:
+            return cached
+
+        task = self._metadata_inflight.get(video_id)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_video_metadata(video_id))
+            self._metadata_inflight[video_id] = task
+            task.add_done_callback(lambda _: self._metadata_inflight.pop(video_id, None))
+        # Shielded so one cancelled caller does not cancel the shared lookup
+        return await asyncio.shield(task)
+
+    async def _fetch_video_metadata(self, video_id: str) -> Dict:
+        """Look up video metadata with yt-dlp, caching successful results"""
         try:
-            ydl_opts = {
-                'quiet': True,
-                'no_warnings': True,
-                'skip_download': True,
-            }
-            
             video_url = f"https://www.youtube.com/watch?v={video_id}"
             
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(video_url, download=False)
-                
-                if not info:
-                    return {
-                        "success": False,
-                        "title": video_id,
-                        "author": "Unknown",
-                        "upload_date": ""
-                    }
-                
+            # extract_info does blocking HTTP; run it off the event loop
+            info = await asyncio.to_thread(
+                lambda: self._get_ydl().extract_info(video_url, download=False)
+            )
+            
+            if not info:
                 return {
-                    "success": True,
-                    "title": info.get('title', video_id),
-                    "author": info.get('uploader', info.get('channel', 'Unknown')),
-                    "upload_date": info.get('upload_date', '')
+                    "success": False,
+                    "title": video_id,
+                    "author": "Unknown",
+                    "upload_date": ""
                 }
+            
+            metadata = {
+                "success": True,
+                "title": info.get('title', video_id),
+                "author": info.get('uploader', info.get('channel', 'Unknown')),
+                "upload_date": info.get('upload_date', '')
+            }
+            self._metadata_cache.set(video_id, metadata)
+            return metadata
                 
         except Exception as e:
             # Fallback to video ID if metadata fetch fails
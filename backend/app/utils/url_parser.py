@@ -2,6 +2,23 @@
 import re
 from typing import Dict, Literal
 
+# Video URL formats, as one alternation with the ID in a named group:
+# youtube.com/watch?v=ID (incl. m.youtube.com), youtu.be/ID, and
+# youtube.com/live/ID, /shorts/ID, /embed/ID
+_VIDEO_PATTERN = (
+    r'youtube\.com/watch\?v=(?P<watch>[a-zA-Z0-9_-]{11})'
+    r'|youtu\.be/(?P<short>[a-zA-Z0-9_-]{11})'
+    r'|youtube\.com/(?:live|shorts|embed)/(?P<path>[a-zA-Z0-9_-]{11})'
+)
+_VIDEO_RE = re.compile(_VIDEO_PATTERN)
+_PLAYLIST_RE = re.compile(r'[?&]list=([a-zA-Z0-9_-]+)')
+# Channel (youtube.com/@username or youtube.com/channel/ID) or video URL,
+# so parse_youtube_url classifies a URL in a single scan
+_URL_RE = re.compile(
+    r'youtube\.com/(?:@(?P<handle>[a-zA-Z0-9_-]+)|channel/(?P<channel>[a-zA-Z0-9_-]+))'
+    r'|' + _VIDEO_PATTERN
+)
+
 
 def extract_video_id(url: str) -> str:
     """
@@ -25,21 +42,10 @@ def extract_video_id(url: str) -> str:
     Raises:
         ValueError: If URL format is invalid or video ID cannot be extracted
     """
-    # Pattern for youtube.com/watch?v=ID format
-    watch_pattern = r'(?:youtube\.com|m\.youtube\.com)/watch\?v=([a-zA-Z0-9_-]{11})'
-    # Pattern for youtu.be/ID format
-    short_pattern = r'youtu\.be/([a-zA-Z0-9_-]{11})'
-    # Pattern for youtube.com/live/ID, /shorts/ID, /embed/ID formats
-    path_pattern = r'youtube\.com/(?:live|shorts|embed)/([a-zA-Z0-9_-]{11})'
-
-    match = (
-        re.search(watch_pattern, url) or
-        re.search(short_pattern, url) or
-        re.search(path_pattern, url)
-    )
+    match = _VIDEO_RE.search(url)
 
     if match:
-        return match.group(1)
+        return match.group(match.lastgroup)
 
     raise ValueError(f"Could not extract video ID from URL: {url}")
 
@@ -61,8 +67,7 @@ def extract_playlist_id(url: str) -> str:
     Raises:
         ValueError: If URL format is invalid or playlist ID cannot be extracted
     """
-    pattern = r'[?&]list=([a-zA-Z0-9_-]+)'
-    match = re.search(pattern, url)
+    match = _PLAYLIST_RE.search(url)
     
     if match:
         return match.group(1)
@@ -90,21 +95,18 @@ def parse_youtube_url(url: str) -> Dict[str, str]:
             'id': extract_playlist_id(url)
         }
     
-    # Check for channel (e.g., youtube.com/@username or youtube.com/channel/ID)
-    channel_pattern = r'youtube\.com/(?:@([a-zA-Z0-9_-]+)|channel/([a-zA-Z0-9_-]+))'
-    channel_match = re.search(channel_pattern, url)
-    if channel_match:
-        channel_id = channel_match.group(1) or channel_match.group(2)
+    match = _URL_RE.search(url)
+    if not match:
+        raise ValueError(f"Invalid YouTube URL: {url}")
+    
+    # Channel (e.g., youtube.com/@username or youtube.com/channel/ID)
+    if match.lastgroup in ('handle', 'channel'):
         return {
             'type': 'channel',
-            'id': channel_id
+            'id': match.group(match.lastgroup)
         }
     
-    # Default to video
-    try:
-        return {
-            'type': 'video',
-            'id': extract_video_id(url)
-        }
-    except ValueError:
-        raise ValueError(f"Invalid YouTube URL: {url}")
+    return {
+        'type': 'video',
+        'id': match.group(match.lastgroup)
+    }
@@ -1,6 +1,10 @@
 """Input validation utilities"""
+import re
 from typing import List
 
+# YouTube video IDs are 11 URL-safe base64 characters
+_VIDEO_ID_RE = re.compile(r'[a-zA-Z0-9_-]{11}')
+
 
 def validate_video_ids(video_ids: List[str]) -> bool:
     """
@@ -22,7 +26,7 @@ def validate_video_ids(video_ids: List[str]) -> bool:
         raise ValueError("Maximum 100 videos allowed per bulk request")
     
     for video_id in video_ids:
-        if not video_id or len(video_id) != 11:
+        if not video_id or not _VIDEO_ID_RE.fullmatch(video_id):
             raise ValueError(f"Invalid video ID format: {video_id}")
     
     return True
@@ -9,6 +9,7 @@ primary key (video_id, user_id) and migrates existing data.
 
 Existing transcripts with NULL user_id will be assigned to a default system user.
 """
+import logging
 from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
@@ -22,6 +23,9 @@ down_revision: Union[str, None] = 'update_transcripts'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Under the alembic logger so alembic.ini's INFO level applies
+logger = logging.getLogger("alembic.runtime.migration")
+
 
 def upgrade() -> None:
     """
@@ -46,7 +50,7 @@ def upgrade() -> None:
 
     if existing_user:
         system_user_id = str(existing_user[0])
-        print(f"Using existing system user: {system_user_id}")
+        logger.info("Using existing system user: %s", system_user_id)
     else:
         # Create system user
         connection.execute(text(
@@ -61,7 +65,7 @@ def upgrade() -> None:
             "is_active": True,
             "is_verified": True
         })
-        print(f"Created system user: {system_user_id}")
+        logger.info("Created system user: %s", system_user_id)
 
     # Step 2: Update NULL user_id values
     result = connection.execute(text(
@@ -70,7 +74,7 @@ def upgrade() -> None:
 
     updated_count = result.rowcount
     if updated_count > 0:
-        print(f"Assigned {updated_count} orphaned transcripts to system user")
+        logger.info("Assigned %d orphaned transcripts to system user", updated_count)
 
     # Step 3: Create new table with composite primary key
     # Using batch mode for SQLite compatibility
@@ -144,7 +148,7 @@ def upgrade() -> None:
     op.drop_table('transcripts')
     op.rename_table('transcripts_new', 'transcripts')
 
-    print("Migration complete: transcripts table now uses composite primary key (video_id, user_id)")
+    logger.info("Migration complete: transcripts table now uses composite primary key (video_id, user_id)")
 
 
 def downgrade() -> None:
@@ -219,4 +223,4 @@ def downgrade() -> None:
     op.drop_table('transcripts')
     op.rename_table('transcripts_old', 'transcripts')
 
-    print("WARNING: Downgrade complete. Duplicate transcripts have been lost.")
+    logger.warning("Downgrade complete. Duplicate transcripts have been lost.")
@@ -18,6 +18,9 @@ down_revision: Union[str, None] = '003_composite_pk'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Rows read and updated per backfill round trip
+BACKFILL_BATCH_SIZE = 1000
+
 
 def upgrade() -> None:
     """
@@ -47,40 +50,37 @@ def upgrade() -> None:
     op.add_column('transcripts', sa.Column('character_count', sa.Integer(), nullable=True))
     op.add_column('transcripts', sa.Column('page_count', sa.Integer(), nullable=True))
 
-    # Step 4: Backfill source_type='youtube' for all existing records
-    connection.execute(text(
-        "UPDATE transcripts SET source_type = 'youtube' WHERE source_type IS NULL"
-    ))
-
-    # Step 5: Set default values for word_count and character_count
-    connection.execute(text(
-        "UPDATE transcripts SET word_count = 0 WHERE word_count IS NULL"
-    ))
-    connection.execute(text(
-        "UPDATE transcripts SET character_count = 0 WHERE character_count IS NULL"
-    ))
-
-    # Step 6: Backfill word_count from existing transcript text
-    # SQLite-compatible word count calculation
-    connection.execute(text("""
-        UPDATE transcripts
-        SET word_count = (
-            LENGTH(transcript) - LENGTH(REPLACE(transcript, ' ', '')) +
-            CASE WHEN LENGTH(TRIM(transcript)) > 0 THEN 1 ELSE 0 END
-        )
-        WHERE word_count = 0 AND transcript IS NOT NULL AND LENGTH(TRIM(transcript)) > 0
-    """))
-
-    # Step 7: Backfill character_count from existing transcript text
-    connection.execute(text("""
-        UPDATE transcripts
-        SET character_count = LENGTH(transcript)
-        WHERE character_count = 0 AND transcript IS NOT NULL
-    """))
+    # Steps 4-7: Backfill source_type='youtube', word_count and character_count
+    # in a single pass; the columns were just added, so every row needs them.
+    # Counts are computed in Python (str.count avoids SQLite building a
+    # REPLACE() copy of every transcript), paging through rows by rowid.
+    last_rowid = 0
+    while True:
+        rows = connection.execute(text("""
+            SELECT rowid, transcript FROM transcripts
+            WHERE rowid > :last_rowid ORDER BY rowid LIMIT :batch_size
+        """), {"last_rowid": last_rowid, "batch_size": BACKFILL_BATCH_SIZE}).fetchall()
+        if not rows:
+            break
+
+        connection.execute(text("""
+            UPDATE transcripts
+            SET source_type = 'youtube', word_count = :word_count, character_count = :character_count
+            WHERE rowid = :rowid
+        """), [
+            {
+                "rowid": rowid,
+                # Same rule as the previous SQL: spaces + 1 for non-blank text
+                "word_count": transcript.count(' ') + 1 if transcript and transcript.strip(' ') else 0,
+                "character_count": len(transcript) if transcript else 0,
+            }
+            for rowid, transcript in rows
+        ])
+        last_rowid = rows[-1][0]
 
     # Step 8: Make source_type NOT NULL now that all rows have values
     # SQLite doesn't support ALTER COLUMN directly, but we can set default for new rows
-    # Existing rows already have 'youtube' from Step 4
+    # Existing rows already have 'youtube' from the backfill above
 
     # Step 9: Create indexes for efficient filtering
     op.create_index('idx_transcripts_source_type', 'transcripts', ['source_type'])
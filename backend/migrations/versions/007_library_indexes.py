@@ -0,0 +1,41 @@
+"""add_library_indexes
+
+Revision ID: 007_library_indexes
+Revises: 006_content_metadata
+Create Date: 2026-01-04 10:00:00.000000
+
+Add composite indexes matching the library view queries, which always
+filter by user_id and then by content_type or sort by created_at.
+"""
+from typing import Sequence, Union
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '007_library_indexes'
+down_revision: Union[str, None] = '006_content_metadata'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Add per-user library indexes to transcripts table.
+
+    - (user_id, content_type): content type filter in advanced search
+    - (user_id, created_at): "recently added" ordering (scanned backwards for DESC)
+    """
+    op.create_index('idx_transcripts_user_content_type', 'transcripts', ['user_id', 'content_type'])
+    op.create_index('idx_transcripts_user_created', 'transcripts', ['user_id', 'created_at'])
+
+    print("✅ Migration 007 complete:")
+    print("  - Created indexes on (user_id, content_type) and (user_id, created_at)")
+
+
+def downgrade() -> None:
+    """
+    Rollback library indexes.
+    """
+    op.drop_index('idx_transcripts_user_created', table_name='transcripts')
+    op.drop_index('idx_transcripts_user_content_type', table_name='transcripts')
+
+    print("✅ Migration 007 rolled back")
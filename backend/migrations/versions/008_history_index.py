@@ -0,0 +1,43 @@
+"""add_history_index
+
+Revision ID: 008_history_index
+Revises: 007_library_indexes
+Create Date: 2026-01-04 12:00:00.000000
+
+Add a composite index for the per-user history listing, which filters by
+user_id and sorts by last_accessed, and refresh planner statistics.
+"""
+from typing import Sequence, Union
+from alembic import op
+from sqlalchemy import text
+
+# revision identifiers, used by Alembic.
+revision: str = '008_history_index'
+down_revision: Union[str, None] = '007_library_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Add per-user history index to transcripts table.
+
+    - (user_id, last_accessed): history listing (scanned backwards for DESC)
+    - ANALYZE so the planner has statistics for this and earlier indexes
+    """
+    op.create_index('idx_transcripts_user_last_accessed', 'transcripts', ['user_id', 'last_accessed'])
+
+    op.get_bind().execute(text("ANALYZE transcripts"))
+
+    print("✅ Migration 008 complete:")
+    print("  - Created index on (user_id, last_accessed)")
+    print("  - Analyzed transcripts table")
+
+
+def downgrade() -> None:
+    """
+    Rollback history index.
+    """
+    op.drop_index('idx_transcripts_user_last_accessed', table_name='transcripts')
+
+    print("✅ Migration 008 rolled back")
@@ -3,11 +3,41 @@
 Simple test to verify logout endpoint parameter configuration.
 Tests the endpoint signature without running the full app.
 """
+import ast
 import sys
 import os
 
-# Add backend to path
-sys.path.insert(0, os.path.dirname(__file__))
+AUTH_FILE = os.path.join(os.path.dirname(__file__), 'app', 'routers', 'auth.py')
+
+
+def _parse_auth_module():
+    """Parse auth.py without importing it (no app, DB or settings startup)"""
+    with open(AUTH_FILE, 'r') as f:
+        return ast.parse(f.read(), filename=AUTH_FILE)
+
+
+def _param_default(tree, func_name, param_name):
+    """Return (found, default AST node or None) for a parameter of a top-level function"""
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == func_name:
+            args = node.args
+            positional = args.posonlyargs + args.args
+            defaults = [None] * (len(positional) - len(args.defaults)) + list(args.defaults)
+            for arg, default in zip(positional + args.kwonlyargs, defaults + list(args.kw_defaults)):
+                if arg.arg == param_name:
+                    return True, default
+            return False, None
+    return False, None
+
+
+def _is_body_call(node):
+    """Check whether a default is a Body(...) / fastapi.Body(...) call"""
+    if not isinstance(node, ast.Call):
+        return False
+    func = node.func
+    return (isinstance(func, ast.Name) and func.id == 'Body') or \
+        (isinstance(func, ast.Attribute) and func.attr == 'Body')
+
 
 def test_endpoint_signatures():
     """Test that endpoints have correct parameter annotations"""
@@ -16,87 +46,45 @@ def test_endpoint_signatures():
     print("="*80)
 
     try:
-        # Import the router module
-        from app.routers import auth
-        from fastapi import Body
-        import inspect
+        tree = _parse_auth_module()
 
-        print("\n[Test 1] Checking /logout endpoint signature")
-        print("-" * 80)
+        for test_number, (func_name, endpoint) in enumerate(
+            [('logout', '/logout'), ('refresh_token', '/refresh')], start=1
+        ):
+            print(f"\n[Test {test_number}] Checking {endpoint} endpoint signature")
+            print("-" * 80)
 
-        # Get the logout function
-        logout_func = auth.logout
-        sig = inspect.signature(logout_func)
+            found, default = _param_default(tree, func_name, 'refresh_token')
 
-        # Check if refresh_token parameter exists
-        if 'refresh_token' not in sig.parameters:
-            print("❌ FAILED: refresh_token parameter not found")
-            return False
+            # Check if refresh_token parameter exists
+            if not found:
+                print("❌ FAILED: refresh_token parameter not found")
+                return False
 
-        # Get the parameter
-        refresh_token_param = sig.parameters['refresh_token']
-
-        # Check if it has a default value (which should be Body(...))
-        has_body_annotation = False
-        if refresh_token_param.default != inspect.Parameter.empty:
-            default_val = refresh_token_param.default
-            # Check if it's a Body field
-            if hasattr(default_val, '__class__'):
-                class_name = default_val.__class__.__name__
-                if 'Body' in class_name or 'FieldInfo' in class_name:
-                    has_body_annotation = True
-
-        print(f"Parameter name: refresh_token")
-        print(f"Parameter default: {refresh_token_param.default}")
-        print(f"Has Body annotation: {has_body_annotation}")
-
-        if has_body_annotation:
-            print("✅ PASSED: refresh_token is configured to accept request body")
-        else:
-            print("❌ FAILED: refresh_token is NOT configured for request body")
-            print("   (It will be treated as query parameter)")
-            return False
-
-        print("\n[Test 2] Checking /refresh endpoint signature")
-        print("-" * 80)
-
-        # Get the refresh_token function
-        refresh_func = auth.refresh_token
-        sig = inspect.signature(refresh_func)
-
-        # Check if refresh_token parameter exists
-        if 'refresh_token' not in sig.parameters:
-            print("❌ FAILED: refresh_token parameter not found")
-            return False
-
-        # Get the parameter
-        refresh_token_param = sig.parameters['refresh_token']
-
-        # Check if it has Body annotation
-        has_body_annotation = False
-        if refresh_token_param.default != inspect.Parameter.empty:
-            default_val = refresh_token_param.default
-            if hasattr(default_val, '__class__'):
-                class_name = default_val.__class__.__name__
-                if 'Body' in class_name or 'FieldInfo' in class_name:
-                    has_body_annotation = True
+            # Check if its default is Body(...)
+            has_body_annotation = _is_body_call(default)
 
-        print(f"Parameter name: refresh_token")
-        print(f"Parameter default: {refresh_token_param.default}")
-        print(f"Has Body annotation: {has_body_annotation}")
+            print(f"Parameter name: refresh_token")
+            print(f"Parameter default: {ast.unparse(default) if default is not None else None}")
+            print(f"Has Body annotation: {has_body_annotation}")
 
-        if has_body_annotation:
-            print("✅ PASSED: refresh_token is configured to accept request body")
-        else:
-            print("❌ FAILED: refresh_token is NOT configured for request body")
-            return False
+            if has_body_annotation:
+                print("✅ PASSED: refresh_token is configured to accept request body")
+            else:
+                print("❌ FAILED: refresh_token is NOT configured for request body")
+                print("   (It will be treated as query parameter)")
+                return False
 
         print("\n[Test 3] Checking Body import in auth module")
         print("-" * 80)
 
         # Check if Body is imported
-        import app.routers.auth as auth_module
-        if hasattr(auth_module, 'Body'):
+        imports_body = any(
+            isinstance(node, ast.ImportFrom) and node.module == 'fastapi'
+            and any(alias.name == 'Body' for alias in node.names)
+            for node in tree.body
+        )
+        if imports_body:
             print("✅ PASSED: Body is imported in auth.py")
         else:
             print("❌ WARNING: Body might not be directly imported")
@@ -116,8 +104,7 @@ def verify_fix_in_code():
     print("-" * 80)
 
     try:
-        auth_file = os.path.join(os.path.dirname(__file__), 'app', 'routers', 'auth.py')
-        with open(auth_file, 'r') as f:
+        with open(AUTH_FILE, 'r') as f:
             content = f.read()
 
         # Check for Body import
@@ -152,7 +139,7 @@ if __name__ == "__main__":
     print("without requiring a full app startup.")
     print("="*80)
 
-    # Run source code check first (doesn't require imports)
+    # Run source code check first
     code_check = verify_fix_in_code()
 
     # Run signature tests
@@ -11,7 +11,7 @@ def client():
     return TestClient(app)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def openai_api_key():
     """OpenAI API key fixture - skip test if not available"""
     key = os.getenv("OPENAI_API_KEY")
@@ -20,7 +20,7 @@ def openai_api_key():
     return key
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_transcript():
     """Sample transcript text for testing"""
     return (
@@ -41,7 +41,7 @@ def sample_video_urls():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_playlist_url():
     """Sample playlist URL for testing"""
     return "https://www.youtube.com/playlist?list=PLrAXtmErZgOeiKm4sgNOknGvNjby9efdf"
@@ -1,6 +1,8 @@
 """Tests for OpenAI service"""
 import pytest
 from unittest.mock import Mock, patch, MagicMock
+from openai import AuthenticationError, RateLimitError
+from app.config import settings
 from app.services.openai_service import OpenAIService
 
 
@@ -10,7 +12,9 @@ class TestOpenAIService:
     @pytest.fixture
     def openai_service(self):
         """Create OpenAIService instance with mocked client"""
-        service = OpenAIService()
+        # Build without a key so no real OpenAI/httpx client is created
+        with patch.object(settings, 'OPENAI_API_KEY', ''):
+            service = OpenAIService()
         # Mock the client
         service.client = Mock()
         return service
@@ -35,8 +39,9 @@ class TestOpenAIService:
     @pytest.mark.asyncio
     async def test_clean_transcript_no_client(self):
         """Test error when OpenAI client not configured"""
-        service = OpenAIService()
-        service.client = None
+        with patch.object(settings, 'OPENAI_API_KEY', ''):
+            service = OpenAIService()
+        assert service.client is None
         
         result = await service.clean_transcript("test transcript")
         
@@ -46,8 +51,6 @@ class TestOpenAIService:
     @pytest.mark.asyncio
     async def test_clean_transcript_authentication_error(self, openai_service, sample_transcript):
         """Test handling of authentication errors"""
-        from openai import AuthenticationError
-        
         openai_service.client.chat.completions.create = Mock(
             side_effect=AuthenticationError("Invalid API key", response=Mock(), body=None)
         )
@@ -60,8 +63,6 @@ class TestOpenAIService:
     @pytest.mark.asyncio
     async def test_clean_transcript_rate_limit_error(self, openai_service, sample_transcript):
         """Test handling of rate limit errors"""
-        from openai import RateLimitError
-        
         openai_service.client.chat.completions.create = Mock(
             side_effect=RateLimitError("Rate limit exceeded", response=Mock(), body=None)
         )
@@ -6,19 +6,13 @@ from app.utils.url_parser import extract_video_id, extract_playlist_id, parse_yo
 class TestExtractVideoId:
     """Tests for extract_video_id function"""
     
-    def test_extract_from_watch_url(self):
-        """Test extraction from youtube.com/watch?v=ID format"""
-        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
-        assert extract_video_id(url) == "dQw4w9WgXcQ"
-    
-    def test_extract_from_short_url(self):
-        """Test extraction from youtu.be/ID format"""
-        url = "https://youtu.be/dQw4w9WgXcQ"
-        assert extract_video_id(url) == "dQw4w9WgXcQ"
-    
-    def test_extract_from_mobile_url(self):
-        """Test extraction from mobile URL"""
-        url = "https://m.youtube.com/watch?v=dQw4w9WgXcQ"
+    @pytest.mark.parametrize("url", [
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://youtu.be/dQw4w9WgXcQ",
+        "https://m.youtube.com/watch?v=dQw4w9WgXcQ",
+    ], ids=["watch", "short", "mobile"])
+    def test_extract_from_url(self, url):
+        """Test extraction from watch, youtu.be and mobile URL formats"""
         assert extract_video_id(url) == "dQw4w9WgXcQ"
     
     def test_invalid_url_raises_error(self):
@@ -47,33 +41,17 @@ class TestExtractPlaylistId:
 class TestParseYoutubeUrl:
     """Tests for parse_youtube_url function"""
     
-    def test_parse_video_url(self):
-        """Test parsing video URL"""
-        url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
-        result = parse_youtube_url(url)
-        assert result["type"] == "video"
-        assert result["id"] == "dQw4w9WgXcQ"
-    
-    def test_parse_playlist_url(self):
-        """Test parsing playlist URL"""
-        url = "https://www.youtube.com/playlist?list=PLtest123"
-        result = parse_youtube_url(url)
-        assert result["type"] == "playlist"
-        assert result["id"] == "PLtest123"
-    
-    def test_parse_channel_url_with_at_symbol(self):
-        """Test parsing channel URL with @ symbol"""
-        url = "https://www.youtube.com/@channelname"
-        result = parse_youtube_url(url)
-        assert result["type"] == "channel"
-        assert result["id"] == "channelname"
-    
-    def test_parse_channel_url_with_channel_id(self):
-        """Test parsing channel URL with channel ID"""
-        url = "https://www.youtube.com/channel/UCtest123"
+    @pytest.mark.parametrize("url, expected_type, expected_id", [
+        ("https://www.youtube.com/watch?v=dQw4w9WgXcQ", "video", "dQw4w9WgXcQ"),
+        ("https://www.youtube.com/playlist?list=PLtest123", "playlist", "PLtest123"),
+        ("https://www.youtube.com/@channelname", "channel", "channelname"),
+        ("https://www.youtube.com/channel/UCtest123", "channel", "UCtest123"),
+    ], ids=["video", "playlist", "channel_handle", "channel_id"])
+    def test_parse_url(self, url, expected_type, expected_id):
+        """Test parsing video, playlist and channel URLs"""
         result = parse_youtube_url(url)
-        assert result["type"] == "channel"
-        assert result["id"] == "UCtest123"
+        assert result["type"] == expected_type
+        assert result["id"] == expected_id
     
     def test_invalid_url_raises_error(self):
         """Test that invalid URL raises ValueError"""
@@ -0,0 +1,260 @@
+"""Tests for web search service"""
+import asyncio
+import httpx
+import pytest
+from unittest.mock import AsyncMock
+from app.services.web_search import WebSearchService, KNOWN_SOURCES, KNOWN_SOURCE_KEYWORDS
+
+
+class TestWebSearchService:
+    """Tests for WebSearchService class"""
+
+    @pytest.fixture
+    def web_search_service(self):
+        """Create WebSearchService instance"""
+        return WebSearchService()
+
+    def test_quick_pattern_match_category(self, web_search_service):
+        """Test known patterns resolve to their category"""
+        result = web_search_service._quick_pattern_match("To be or not to be, that is the question")
+
+        assert result is not None
+        assert result.source_type == "literary"
+        assert result.verified is False
+
+    def test_quick_pattern_match_no_match(self, web_search_service):
+        """Test unrelated text has no pattern match"""
+        assert web_search_service._quick_pattern_match("the weather is nice today") is None
+
+    def test_extract_source_bible_reference(self, web_search_service):
+        """Test Bible references are extracted from search results"""
+        result = web_search_service._extract_source_from_result(
+            "john 3:16 - kjv", "for god so loved the world", "https://example.com"
+        )
+
+        assert result["source"] == "Bible - John 3:16"
+        assert result["type"] == "religious"
+
+    def test_extract_source_famous_author(self, web_search_service):
+        """Test famous authors are extracted from search results"""
+        result = web_search_service._extract_source_from_result(
+            "famous quote", "attributed to albert einstein", "https://example.com"
+        )
+
+        assert result["source"] == "Albert Einstein"
+        assert result["type"] == "scientific"
+
+    @pytest.mark.asyncio
+    async def test_verify_quotes_batch_preserves_order(self, web_search_service):
+        """Test batch results come back in input order with bounded concurrency"""
+        in_flight = 0
+        peak = 0
+
+        async def fake_search(search_query, limit):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"results": []}
+
+        web_search_service._fetch_search = AsyncMock(side_effect=fake_search)
+        quotes = [f"original phrase number {i}" for i in range(12)]
+
+        results = await web_search_service.verify_quotes_batch(quotes)
+
+        assert [r.quote for r in results] == quotes
+        assert peak <= web_search_service.BATCH_CONCURRENCY
+
+    @pytest.mark.asyncio
+    async def test_verify_quote_uses_cache(self, web_search_service):
+        """Test repeated quotes are served from cache"""
+        web_search_service._search_searxng = AsyncMock(return_value={"results": []})
+
+        first = await web_search_service.verify_quote("An original phrase")
+        second = await web_search_service.verify_quote("  an ORIGINAL phrase ")
+
+        assert web_search_service._search_searxng.await_count == 1
+        assert second.quote == "  an ORIGINAL phrase "
+        assert second.verification_details == first.verification_details
+
+    @pytest.mark.asyncio
+    async def test_verify_quote_does_not_cache_failures(self, web_search_service):
+        """Test failed searches are retried on the next call"""
+        web_search_service._search_searxng = AsyncMock(side_effect=Exception("boom"))
+
+        result = await web_search_service.verify_quote("An original phrase")
+        await web_search_service.verify_quote("An original phrase")
+
+        assert result.verified is False
+        assert web_search_service._search_searxng.await_count == 2
+
+    def test_known_source_keywords_cover_patterns(self):
+        """Test every known-source pattern contains one of the prefilter keywords"""
+        for patterns in KNOWN_SOURCES.values():
+            for pattern in patterns:
+                assert any(keyword in pattern for keyword in KNOWN_SOURCE_KEYWORDS), pattern
+
+    def test_quick_pattern_match_literal_keyword(self, web_search_service):
+        """Test single-word patterns match whole words, including possessives"""
+        result = web_search_service._quick_pattern_match("As in Plato's dialogues")
+
+        assert result is not None
+        assert result.source_type == "philosophical"
+
+    def test_quick_pattern_match_leftmost_wins(self, web_search_service):
+        """Test an earlier multi-word match beats a later single-word one"""
+        religious = web_search_service._quick_pattern_match("John 3:16, as Plato wrote")
+        philosophical = web_search_service._quick_pattern_match("As Plato wrote in John 3:16")
+
+        assert religious.source_type == "religious"
+        assert philosophical.source_type == "philosophical"
+
+    @pytest.mark.asyncio
+    async def test_search_searxng_revalidates_with_etag(self, web_search_service):
+        """Test repeated searches send If-None-Match and reuse results on 304"""
+        payload = b'{"results": [{"title": "t", "content": "c", "url": "u"}]}'
+        responses = [
+            httpx.Response(200, content=payload, headers={"ETag": '"abc"'}),
+            httpx.Response(304),
+        ]
+        seen_headers = []
+
+        def handler(request):
+            seen_headers.append(request.headers.get("if-none-match"))
+            response = responses.pop(0)
+            response.request = request
+            return response
+
+        web_search_service._client = httpx.AsyncClient(
+            base_url=web_search_service.searxng_url,
+            transport=httpx.MockTransport(handler)
+        )
+
+        first = await web_search_service._search_searxng("some quote")
+        second = await web_search_service._search_searxng("some quote")
+
+        assert seen_headers == [None, '"abc"']
+        assert second == first
+        await web_search_service.aclose()
+
+    @pytest.mark.asyncio
+    async def test_verify_quotes_batch_combines_short_quotes(self, web_search_service):
+        """Test short quotes share one search and unmatched quotes fall back"""
+        combined_results = {"results": [{
+            "title": "Famous quote by Mark Twain",
+            "content": "He said: the first phrase here, and more",
+            "url": "https://example.com/twain"
+        }]}
+
+        async def fake_search(search_query, limit):
+            if " OR " in search_query and search_query.startswith('"The first'):
+                return combined_results
+            return {"results": []}
+
+        web_search_service._fetch_search = AsyncMock(side_effect=fake_search)
+        quotes = ["The first  phrase here", "a second phrase here"]
+
+        results = await web_search_service.verify_quotes_batch(quotes)
+
+        assert results[0].source == "Mark Twain"
+        assert results[1].source is None
+        # One combined search plus one individual fallback
+        assert web_search_service._fetch_search.await_count == 2
+
+    def test_parse_claim_results_weighs_fact_check_sites(self, web_search_service):
+        """Test verdict keywords classify results and fact-check sites count double"""
+        results = {"results": [
+            {"title": "Claim rated FALSE", "content": "This is a myth",
+             "url": "https://www.Snopes.com/fact-check/claim"},
+            {"title": "Debunked", "content": "Misleading statistics",
+             "url": "https://example.com/a"},
+            {"title": "An unrelated page", "content": "Nothing to see",
+             "url": "https://example.com/b"},
+        ]}
+
+        result = web_search_service._parse_claim_results("The claim under test here", results)
+
+        assert result.verification_status == "disputed"
+        # Two contradicting results, the fact-check site counted twice
+        assert result.confidence == pytest.approx(0.8)
+        assert result.contradicting_sources == [
+            "https://www.Snopes.com/fact-check/claim",
+            "https://example.com/a",
+        ]
+        assert result.supporting_sources == []
+
+    @pytest.mark.asyncio
+    async def test_verify_claims_batch_overlaps_searches(self, web_search_service):
+        """Test claims are searched concurrently and returned in input order"""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_search(claim_text):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"results": []}
+
+        web_search_service._search_claim = AsyncMock(side_effect=fake_search)
+        claims = [f"Claim number {i} is long enough to verify" for i in range(6)]
+
+        results = await web_search_service.verify_claims_batch(
+            claims, rate_limit_delay=0, concurrency=3
+        )
+
+        assert [r.claim_text for r in results] == claims
+        assert max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_claims_share_one_search(self, web_search_service):
+        """Test concurrent lookups of one claim share a search, and hits are cached"""
+        async def fake_search(claim_text):
+            await asyncio.sleep(0.01)
+            return {"results": []}
+
+        web_search_service._search_claim = AsyncMock(side_effect=fake_search)
+        claim = "The moon is made of green cheese entirely"
+
+        first, second = await asyncio.gather(
+            web_search_service.verify_claim(claim),
+            web_search_service.verify_claim("  the moon is made of  GREEN cheese entirely")
+        )
+        third = await web_search_service.verify_claim(claim)
+
+        assert web_search_service._search_claim.await_count == 1
+        assert second.claim_text == "  the moon is made of  GREEN cheese entirely"
+        assert first.verification_status == third.verification_status == "unverified"
+
+    def test_parse_claim_results_matches_verdicts_at_word_start(self, web_search_service):
+        """Test "incorrect"/"unverified" are not read as supporting verdicts"""
+        results = {"results": [
+            {"title": "This claim is incorrect", "content": "", "url": "https://example.com/a"},
+            {"title": "Unverified rumor", "content": "", "url": "https://example.com/b"},
+        ]}
+
+        result = web_search_service._parse_claim_results("The claim under test here", results)
+
+        assert result.contradicting_sources == ["https://example.com/a"]
+        assert result.supporting_sources == []
+
+    @pytest.mark.asyncio
+    async def test_check_connection_single_head_cached(self, web_search_service):
+        """Test the health check is one HEAD request, reused while fresh"""
+        methods = []
+
+        def handler(request):
+            methods.append(request.method)
+            return httpx.Response(405)
+
+        web_search_service._client = httpx.AsyncClient(
+            base_url=web_search_service.searxng_url,
+            transport=httpx.MockTransport(handler)
+        )
+
+        assert await web_search_service.check_connection() is True
+        assert await web_search_service.check_connection() is True
+        assert methods == ["HEAD"]
+        await web_search_service.aclose()
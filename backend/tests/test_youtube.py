@@ -1,6 +1,10 @@
 """Tests for YouTube service"""
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
+from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFound, VideoUnavailable
 from app.services.youtube import YouTubeService
 
 
@@ -12,52 +16,105 @@ class TestYouTubeService:
         """Create YouTubeService instance"""
         return YouTubeService()
     
+    @pytest.fixture
+    def transcript_api(self, youtube_service):
+        """Mock YouTubeTranscriptApi handed to every worker thread"""
+        api = Mock()
+        youtube_service._get_api = Mock(return_value=api)
+        return api
+    
     @pytest.mark.asyncio
-    async def test_get_transcript_success(self, youtube_service):
+    async def test_get_transcript_success(self, youtube_service, transcript_api):
         """Test successful transcript fetching"""
         # Mock the API response
-        mock_transcript = [
-            {"text": "Hello", "start": 0.0, "duration": 1.5},
-            {"text": "World", "start": 1.5, "duration": 1.5}
+        snippets = [
+            Mock(text="Hello", start=0.0, duration=1.5),
+            Mock(text="World", start=1.5, duration=1.5)
         ]
         
-        with patch.object(youtube_service.api, 'get_transcript', return_value=mock_transcript):
-            result = await youtube_service.get_transcript("test_video_id")
-            
-            assert result["success"] is True
-            assert len(result["transcript"]) == 2
-            assert result["text"] == "Hello World"
-            assert result["transcript"][0]["text"] == "Hello"
+        transcript_api.fetch = Mock(return_value=snippets)
+        result = await youtube_service.get_transcript("test_video_id")
+
+        assert result["success"] is True
+        assert len(result["transcript"]) == 2
+        assert result["text"] == "Hello World"
+        assert result["transcript"][0]["text"] == "Hello"
     
     @pytest.mark.asyncio
-    async def test_get_transcript_disabled(self, youtube_service):
+    async def test_get_transcript_disabled(self, youtube_service, transcript_api):
         """Test handling of disabled transcripts"""
-        from youtube_transcript_api._errors import TranscriptsDisabled
-        
-        with patch.object(youtube_service.api, 'get_transcript', side_effect=TranscriptsDisabled("test")):
-            result = await youtube_service.get_transcript("test_video_id")
-            
-            assert result["success"] is False
-            assert "disabled" in result["error"].lower()
+        transcript_api.fetch = Mock(side_effect=TranscriptsDisabled("test"))
+        result = await youtube_service.get_transcript("test_video_id")
+
+        assert result["success"] is False
+        assert "disabled" in result["error"].lower()
     
     @pytest.mark.asyncio
-    async def test_get_transcript_not_found(self, youtube_service):
+    async def test_get_transcript_not_found(self, youtube_service, transcript_api):
         """Test handling of missing transcripts"""
-        from youtube_transcript_api._errors import NoTranscriptFound
-        
-        with patch.object(youtube_service.api, 'get_transcript', side_effect=NoTranscriptFound("test", "test", [])):
-            result = await youtube_service.get_transcript("test_video_id")
-            
-            assert result["success"] is False
-            assert "not found" in result["error"].lower()
+        transcript_api.fetch = Mock(side_effect=NoTranscriptFound("test", "test", []))
+        result = await youtube_service.get_transcript("test_video_id")
+
+        assert result["success"] is False
+        assert "no transcript found" in result["error"].lower()
     
     @pytest.mark.asyncio
-    async def test_get_transcript_video_unavailable(self, youtube_service):
+    async def test_get_transcript_video_unavailable(self, youtube_service, transcript_api):
         """Test handling of unavailable videos"""
-        from youtube_transcript_api._errors import VideoUnavailable
+        transcript_api.fetch = Mock(side_effect=VideoUnavailable("test"))
+        result = await youtube_service.get_transcript("test_video_id")
+
+        assert result["success"] is False
+        assert "unavailable" in result["error"].lower()
+    
+    @pytest.mark.asyncio
+    async def test_get_transcript_cached(self, youtube_service, transcript_api):
+        """Test repeat requests for a video are served from the cache"""
+        snippets = [
+            Mock(text="Hello", start=0.0, duration=1.5),
+            Mock(text="World", start=1.5, duration=1.5)
+        ]
+        
+        transcript_api.fetch = Mock(return_value=snippets)
+        first = await youtube_service.get_transcript("test_video_id")
+        second = await youtube_service.get_transcript("test_video_id")
+
+        assert first["text"] == "Hello World"
+        assert second == first
+        transcript_api.fetch.assert_called_once_with("test_video_id")
+    
+    @pytest.mark.asyncio
+    async def test_get_transcript_timeout(self, youtube_service, transcript_api):
+        """Test a hung fetch is abandoned after FETCH_TIMEOUT"""
+        youtube_service.FETCH_TIMEOUT = 0.01
+        transcript_api.fetch = Mock(side_effect=lambda video_id: time.sleep(0.2))
+        result = await youtube_service.get_transcript("test_video_id")
+
+        assert result["success"] is False
+        assert "timed out" in result["error"]
+    
+    def test_get_api_per_thread(self, youtube_service):
+        """Test each worker thread gets its own transcript API instance"""
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other = executor.submit(youtube_service._get_api).result()
+        
+        assert youtube_service._get_api() is youtube_service._get_api()
+        assert youtube_service._get_api() is not other
+    
+    @pytest.mark.asyncio
+    async def test_get_video_metadata_shared_and_cached(self, youtube_service):
+        """Test concurrent and repeat metadata lookups hit yt-dlp once"""
+        info = {"title": "Test Video", "uploader": "Test Channel", "upload_date": "20240101"}
         
-        with patch.object(youtube_service.api, 'get_transcript', side_effect=VideoUnavailable("test")):
-            result = await youtube_service.get_transcript("test_video_id")
+        with patch.object(youtube_service, '_get_ydl') as mock_get_ydl:
+            mock_get_ydl.return_value.extract_info.return_value = info
+            first, second = await asyncio.gather(
+                youtube_service.get_video_metadata("test_video_id"),
+                youtube_service.get_video_metadata("test_video_id")
+            )
+            third = await youtube_service.get_video_metadata("test_video_id")
             
-            assert result["success"] is False
-            assert "unavailable" in result["error"].lower()
+            assert first["title"] == "Test Video"
+            assert first == second == third
+            mock_get_ydl.return_value.extract_info.assert_called_once()
+    